@@ -1,4 +1,6 @@
 """Configuration settings for Q-CHAT backend."""
+import os
+
 from pydantic import ConfigDict
 from pydantic_settings import BaseSettings
 
@@ -15,6 +17,7 @@ class Settings(BaseSettings):
 
     # Server
     port: int = 8000
+    web_concurrency: int = os.cpu_count() or 1
     base_url: str = "http://localhost:8000"
 
     # Database
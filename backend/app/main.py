@@ -2,8 +2,9 @@
 from datetime import datetime
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
 from .config import settings
 from .models import (
@@ -18,7 +19,7 @@ from .models import (
     SubmitAnswerRequest,
     SubmitAnswerResponse,
 )
-from .questions import QCHAT_QUESTIONS, get_question
+from .questions import get_all_questions_json, get_option, get_question
 from .scoring import assess_risk, calculate_point, calculate_total_score, get_recommendations_bilingual
 from .utils import (
     generate_session_token,
@@ -31,6 +32,7 @@ app = FastAPI(
     title="Q-CHAT-10 API",
     description="Quantitative Checklist for Autism in Toddlers API",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -43,6 +45,16 @@ app.add_middleware(
 )
 
 
+def get_session_data(session_token: str) -> dict:
+    """Load the session for the request path or raise 404."""
+    session_data = load_session(session_token)
+
+    if not session_data:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return session_data
+
+
 @app.get("/")
 def read_root():
     """Root endpoint."""
@@ -89,13 +101,8 @@ def create_session(request: CreateSessionRequest):
 
 
 @app.get("/api/sessions/{session_token}", response_model=SessionResponse)
-def get_session(session_token: str):
+def get_session(session_data: dict = Depends(get_session_data)):
     """Get session details."""
-    session_data = load_session(session_token)
-
-    if not session_data:
-        raise HTTPException(status_code=404, detail="Session not found")
-
     # Convert answers to Answer models
     answers = [
         Answer(
@@ -130,18 +137,14 @@ def get_question_endpoint(session_token: str, question_number: int):
     if not session_exists(session_token):
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Validate question number
-    if question_number < 1 or question_number > 10:
-        raise HTTPException(status_code=400, detail="Question number must be between 1 and 10")
-
-    # Get question data
+    # Get question data (only questions 1-10 exist)
     question_data = get_question(question_number)
     if not question_data:
-        raise HTTPException(status_code=404, detail="Question not found")
+        raise HTTPException(status_code=400, detail="Question number must be between 1 and 10")
 
-    # Convert to response model
+    # Question data is static and server-owned, so skip model validation
     options = [
-        QuestionOption(
+        QuestionOption.model_construct(
             value=opt["value"],
             label_en=opt["label_en"],
             label_ar=opt["label_ar"],
@@ -149,7 +152,7 @@ def get_question_endpoint(session_token: str, question_number: int):
         for opt in question_data["options"]
     ]
 
-    return QuestionResponse(
+    return QuestionResponse.model_construct(
         question_number=question_data["question_number"],
         text_en=question_data["text_en"],
         text_ar=question_data["text_ar"],
@@ -160,47 +163,37 @@ def get_question_endpoint(session_token: str, question_number: int):
 
 
 @app.post("/api/sessions/{session_token}/answer", response_model=SubmitAnswerResponse)
-def submit_answer(session_token: str, request: SubmitAnswerRequest):
+def submit_answer(
+    session_token: str,
+    request: SubmitAnswerRequest,
+    session_data: dict = Depends(get_session_data),
+):
     """Submit an answer to a question."""
-    session_data = load_session(session_token)
-
-    if not session_data:
-        raise HTTPException(status_code=404, detail="Session not found")
-
     # Check if session is already completed
     if session_data["status"] == SessionStatus.COMPLETED.value:
         raise HTTPException(status_code=400, detail="Session already completed")
 
-    # Validate question number
-    if request.question_number < 1 or request.question_number > 10:
-        raise HTTPException(status_code=400, detail="Question number must be between 1 and 10")
-
-    # Get question data to get the option label
-    question_data = get_question(request.question_number)
-    if not question_data:
-        raise HTTPException(status_code=404, detail="Question not found")
-
     # Find the option label
-    option_label = None
-    language = session_data.get("language", "en")
-    for opt in question_data["options"]:
-        if opt["value"] == request.selected_option.value:
-            option_label = opt[f"label_{language}"]
-            break
-
-    if not option_label:
+    # (question_number is range-checked by SubmitAnswerRequest)
+    option = get_option(request.question_number, request.selected_option.value)
+    if not option:
         raise HTTPException(status_code=400, detail="Invalid option")
 
+    language = session_data.get("language", "en")
+    option_label = option[f"label_{language}"]
+
     # Calculate if this answer scores a point
     scored_point = calculate_point(request.question_number, request.selected_option.value)
 
+    now = datetime.utcnow()
+
     # Create answer record
     answer = {
         "question_number": request.question_number,
         "selected_option": request.selected_option.value,
         "option_label": option_label,
         "scored_point": scored_point,
-        "answered_at": datetime.utcnow(),
+        "answered_at": now,
     }
 
     # Check if question already answered - if so, update it; otherwise append
@@ -210,14 +203,17 @@ def submit_answer(session_token: str, request: SubmitAnswerRequest):
         None
     )
 
+    previous_option = None
     if answer_index is not None:
         # Update existing answer
+        previous_option = existing_answers[answer_index]["selected_option"]
         session_data["answers"][answer_index] = answer
     else:
         # Add new answer
         session_data["answers"].append(answer)
 
     # Update current question
+    previous_progress = (session_data["current_question"], session_data["status"])
     next_question = request.question_number + 1
     if next_question <= 10:
         session_data["current_question"] = next_question
@@ -225,13 +221,18 @@ def submit_answer(session_token: str, request: SubmitAnswerRequest):
     else:
         session_data["current_question"] = 10
         session_data["status"] = SessionStatus.COMPLETED.value
-        session_data["completed_at"] = datetime.utcnow()
+        session_data["completed_at"] = now
 
     # Calculate current score
     current_score = calculate_total_score(session_data["answers"])
 
-    # Save session
-    save_session(session_token, session_data)
+    # Save session, unless this is a retry that leaves it unchanged
+    unchanged = (
+        previous_option == answer["selected_option"]
+        and previous_progress == (session_data["current_question"], session_data["status"])
+    )
+    if not unchanged:
+        save_session(session_token, session_data)
 
     # Prepare response
     is_complete = len(session_data["answers"]) >= 10
@@ -246,13 +247,8 @@ def submit_answer(session_token: str, request: SubmitAnswerRequest):
 
 
 @app.get("/api/sessions/{session_token}/report", response_model=ReportResponse)
-def get_report(session_token: str):
+def get_report(session_data: dict = Depends(get_session_data)):
     """Get the screening report for a completed session."""
-    session_data = load_session(session_token)
-
-    if not session_data:
-        raise HTTPException(status_code=404, detail="Session not found")
-
     # Check if session is completed
     if session_data["status"] != SessionStatus.COMPLETED.value:
         raise HTTPException(status_code=400, detail="Session not completed yet")
@@ -269,7 +265,7 @@ def get_report(session_token: str):
     risk_level = risk_assessment["risk_level"]
     recommendations = bilingual_recs.get(language, bilingual_recs["en"])[risk_level]
 
-    # Convert answers to Answer models
+    # Convert answers to Answer models (stored data, already validated on submit)
     answers = []
     for ans in session_data["answers"]:
         # Get question text for this answer
@@ -278,7 +274,7 @@ def get_report(session_token: str):
         question_text_ar = question_data["text_ar"] if question_data else ""
         
         answers.append(
-            Answer(
+            Answer.model_construct(
                 question_number=ans["question_number"],
                 selected_option=ans["selected_option"],
                 option_label=ans["option_label"],
@@ -307,32 +303,19 @@ def get_report(session_token: str):
 @app.get("/api/questions", response_model=list[QuestionResponse])
 def get_all_questions():
     """Get all Q-CHAT questions."""
-    questions = []
-    for q_data in QCHAT_QUESTIONS:
-        options = [
-            QuestionOption(
-                value=opt["value"],
-                label_en=opt["label_en"],
-                label_ar=opt["label_ar"],
-            )
-            for opt in q_data["options"]
-        ]
-
-        questions.append(
-            QuestionResponse(
-                question_number=q_data["question_number"],
-                text_en=q_data["text_en"],
-                text_ar=q_data["text_ar"],
-                options=options,
-                video_positive=q_data.get("video_positive"),
-                video_negative=q_data.get("video_negative"),
-            )
-        )
-
-    return questions
+    # Static payload, serialized once at import instead of per request
+    return Response(content=get_all_questions_json(), media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=settings.port)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=settings.port,
+        workers=settings.web_concurrency,
+        loop="auto",
+        http="auto",
+        log_level=settings.log_level.lower(),
+    )
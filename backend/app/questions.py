@@ -1,6 +1,10 @@
 """Q-CHAT-10 questions and options data."""
+from collections.abc import Mapping
+from types import MappingProxyType
 
-QCHAT_QUESTIONS = [
+import orjson
+
+_QUESTIONS = [
     {
         "question_number": 1,
         "text_en": "Does your child look at you when you call his/her name?",
@@ -144,14 +148,43 @@ QCHAT_QUESTIONS = [
 ]
 
 
-def get_question(question_number: int) -> dict | None:
+def _freeze_question(question: dict) -> Mapping:
+    """Return a read-only view of a question and its options."""
+    options = tuple(MappingProxyType(opt) for opt in question["options"])
+    return MappingProxyType({**question, "options": options})
+
+
+# Read-only question bank, safe to share across requests
+QCHAT_QUESTIONS: tuple[Mapping, ...] = tuple(_freeze_question(q) for q in _QUESTIONS)
+
+# The bank is static, so serialize it once (same shape as QuestionResponse)
+_QUESTIONS_JSON = orjson.dumps(_QUESTIONS)
+
+# Index questions by number for O(1) lookup
+_QUESTIONS_BY_NUMBER = {q["question_number"]: q for q in QCHAT_QUESTIONS}
+
+# Index each question's options by value (A-E)
+_OPTIONS_BY_VALUE = {
+    q["question_number"]: {opt["value"]: opt for opt in q["options"]}
+    for q in QCHAT_QUESTIONS
+}
+
+
+def get_question(question_number: int) -> Mapping | None:
     """Get a question by number."""
-    for q in QCHAT_QUESTIONS:
-        if q["question_number"] == question_number:
-            return q
-    return None
+    return _QUESTIONS_BY_NUMBER.get(question_number)
+
 
+def get_option(question_number: int, value: str) -> Mapping | None:
+    """Get a question's option by value."""
+    return _OPTIONS_BY_VALUE.get(question_number, {}).get(value)
 
-def get_all_questions() -> list[dict]:
+
+def get_all_questions() -> tuple[Mapping, ...]:
     """Get all questions."""
     return QCHAT_QUESTIONS
+
+
+def get_all_questions_json() -> bytes:
+    """Get all questions as pre-serialized JSON."""
+    return _QUESTIONS_JSON
@@ -1,24 +1,67 @@
 """Q-CHAT-10 scoring logic."""
+from collections.abc import Mapping
+from types import MappingProxyType
 
 # Scoring rules for each question
 # Questions 1-9: Score 1 point if C, D, or E is selected
 # Question 10: Score 1 point if A, B, or C is selected (REVERSED)
 SCORING_RULES = {
-    1: ["C", "D", "E"],
-    2: ["C", "D", "E"],
-    3: ["C", "D", "E"],
-    4: ["C", "D", "E"],
-    5: ["C", "D", "E"],
-    6: ["C", "D", "E"],
-    7: ["C", "D", "E"],
-    8: ["C", "D", "E"],
-    9: ["C", "D", "E"],
-    10: ["A", "B", "C"],  # REVERSED SCORING
+    1: frozenset({"C", "D", "E"}),
+    2: frozenset({"C", "D", "E"}),
+    3: frozenset({"C", "D", "E"}),
+    4: frozenset({"C", "D", "E"}),
+    5: frozenset({"C", "D", "E"}),
+    6: frozenset({"C", "D", "E"}),
+    7: frozenset({"C", "D", "E"}),
+    8: frozenset({"C", "D", "E"}),
+    9: frozenset({"C", "D", "E"}),
+    10: frozenset({"A", "B", "C"}),  # REVERSED SCORING
+}
+
+# Bitmask form of SCORING_RULES: one bit per option (A=1, B=2, ..., E=16)
+_OPTION_BITS = {option: 1 << i for i, option in enumerate("ABCDE")}
+_SCORING_MASKS = {
+    q_num: sum(_OPTION_BITS[option] for option in options)
+    for q_num, options in SCORING_RULES.items()
 }
 
 # Referral threshold
 REFERRAL_THRESHOLD = 3  # Score > 3 means referral recommended
 
+# Recommendations by language and risk level
+_RECOMMENDATIONS = {
+    "en": {
+        "high": (
+            "Your child's score suggests a need for further evaluation.",
+            "We recommend scheduling an appointment with a pediatrician or developmental specialist.",
+            "Early intervention can make a significant difference in outcomes.",
+            "Please bring this report to your healthcare provider.",
+            "Consider asking for a referral to a multidisciplinary assessment team.",
+        ),
+        "low": (
+            "Your child's score is within the typical range.",
+            "Continue to monitor your child's development.",
+            "If you have ongoing concerns, discuss them with your pediatrician.",
+            "Regular developmental checkups are important for all children.",
+        ),
+    },
+    "ar": {
+        "high": (
+            "تشير درجة طفلك إلى الحاجة لمزيد من التقييم.",
+            "نوصي بتحديد موعد مع طبيب أطفال أو أخصائي تطور.",
+            "التدخل المبكر يمكن أن يحدث فرقاً كبيراً في النتائج.",
+            "يرجى إحضار هذا التقرير إلى مقدم الرعاية الصحية الخاص بك.",
+            "فكر في طلب إحالة إلى فريق تقييم متعدد التخصصات.",
+        ),
+        "low": (
+            "درجة طفلك ضمن النطاق الطبيعي.",
+            "استمر في مراقبة تطور طفلك.",
+            "إذا كانت لديك مخاوف مستمرة، ناقشها مع طبيب الأطفال.",
+            "الفحوصات التطورية المنتظمة مهمة لجميع الأطفال.",
+        ),
+    },
+}
+
 
 def calculate_point(question_number: int, selected_option: str) -> bool:
     """
@@ -31,10 +74,7 @@ def calculate_point(question_number: int, selected_option: str) -> bool:
     Returns:
         bool: True if point should be scored, False otherwise
     """
-    if question_number not in SCORING_RULES:
-        return False
-
-    return selected_option in SCORING_RULES[question_number]
+    return selected_option in SCORING_RULES.get(question_number, ())
 
 
 def calculate_total_score(answers: list[dict]) -> int:
@@ -49,41 +89,17 @@ def calculate_total_score(answers: list[dict]) -> int:
     """
     score = 0
     for answer in answers:
-        q_num = answer.get("question_number")
-        option = answer.get("selected_option")
-        if q_num and option and calculate_point(q_num, option):
-            score += 1
+        mask = _SCORING_MASKS.get(answer.get("question_number"), 0)
+        score += (mask & _OPTION_BITS.get(answer.get("selected_option"), 0)) != 0
     return score
 
 
-def assess_risk(total_score: int) -> dict:
-    """
-    Assess risk level based on total score.
-
-    Args:
-        total_score: Total score (0-10)
-
-    Returns:
-        dict: Risk assessment with recommendations
-    """
+def _build_assessment(total_score: int) -> dict:
+    """Build the risk assessment dict for a total score."""
     recommend_referral = total_score > REFERRAL_THRESHOLD
     risk_level = "high" if recommend_referral else "low"
 
-    if recommend_referral:
-        recommendations = [
-            "Your child's score suggests a need for further evaluation.",
-            "We recommend scheduling an appointment with a pediatrician or developmental specialist.",
-            "Early intervention can make a significant difference in outcomes.",
-            "Please bring this report to your healthcare provider.",
-            "Consider asking for a referral to a multidisciplinary assessment team.",
-        ]
-    else:
-        recommendations = [
-            "Your child's score is within the typical range.",
-            "Continue to monitor your child's development.",
-            "If you have ongoing concerns, discuss them with your pediatrician.",
-            "Regular developmental checkups are important for all children.",
-        ]
+    recommendations = _RECOMMENDATIONS["en"][risk_level]
 
     return {
         "total_score": total_score,
@@ -95,37 +111,25 @@ def assess_risk(total_score: int) -> dict:
     }
 
 
+# Scores only range 0-10, so every assessment is built once at import
+_ASSESSMENTS = tuple(MappingProxyType(_build_assessment(score)) for score in range(11))
+
+
+def assess_risk(total_score: int) -> Mapping:
+    """
+    Assess risk level based on total score.
+
+    Args:
+        total_score: Total score (0-10)
+
+    Returns:
+        Mapping: Read-only risk assessment with recommendations
+    """
+    if 0 <= total_score < len(_ASSESSMENTS):
+        return _ASSESSMENTS[total_score]
+    return _build_assessment(total_score)
+
+
 def get_recommendations_bilingual() -> dict:
     """Get recommendations in both English and Arabic."""
-    return {
-        "en": {
-            "high": [
-                "Your child's score suggests a need for further evaluation.",
-                "We recommend scheduling an appointment with a pediatrician or developmental specialist.",
-                "Early intervention can make a significant difference in outcomes.",
-                "Please bring this report to your healthcare provider.",
-                "Consider asking for a referral to a multidisciplinary assessment team.",
-            ],
-            "low": [
-                "Your child's score is within the typical range.",
-                "Continue to monitor your child's development.",
-                "If you have ongoing concerns, discuss them with your pediatrician.",
-                "Regular developmental checkups are important for all children.",
-            ],
-        },
-        "ar": {
-            "high": [
-                "تشير درجة طفلك إلى الحاجة لمزيد من التقييم.",
-                "نوصي بتحديد موعد مع طبيب أطفال أو أخصائي تطور.",
-                "التدخل المبكر يمكن أن يحدث فرقاً كبيراً في النتائج.",
-                "يرجى إحضار هذا التقرير إلى مقدم الرعاية الصحية الخاص بك.",
-                "فكر في طلب إحالة إلى فريق تقييم متعدد التخصصات.",
-            ],
-            "low": [
-                "درجة طفلك ضمن النطاق الطبيعي.",
-                "استمر في مراقبة تطور طفلك.",
-                "إذا كانت لديك مخاوف مستمرة، ناقشها مع طبيب الأطفال.",
-                "الفحوصات التطورية المنتظمة مهمة لجميع الأطفال.",
-            ],
-        },
-    }
+    return _RECOMMENDATIONS
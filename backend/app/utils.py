@@ -1,13 +1,19 @@
 """Utility functions for Q-CHAT backend."""
-import json
 import os
 import secrets
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+import orjson
 
 from .config import settings
 
+# Session storage directory, created once at import
+_STORAGE_PATH = Path(settings.data_storage_path)
+_STORAGE_PATH.mkdir(parents=True, exist_ok=True)
+
 
 def generate_session_token() -> str:
     """Generate a unique session token."""
@@ -16,9 +22,7 @@ def generate_session_token() -> str:
 
 def get_session_file_path(session_token: str) -> Path:
     """Get the file path for a session JSON file."""
-    storage_path = Path(settings.data_storage_path)
-    storage_path.mkdir(parents=True, exist_ok=True)
-    return storage_path / f"{session_token}.json"
+    return _STORAGE_PATH / f"{session_token}.json"
 
 
 def save_session(session_token: str, session_data: dict) -> None:
@@ -31,11 +35,19 @@ def save_session(session_token: str, session_data: dict) -> None:
     """
     file_path = get_session_file_path(session_token)
 
-    # Convert datetime objects to ISO format strings
-    data_to_save = _prepare_for_json(session_data)
+    # orjson writes datetime objects as ISO format strings natively
+    option = orjson.OPT_INDENT_2 if settings.debug else 0
+    content = orjson.dumps(session_data, option=option)
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data_to_save, f, ensure_ascii=False, indent=2)
+    # Write to a temp file and rename so readers never see a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=_STORAGE_PATH, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def load_session(session_token: str) -> dict | None:
@@ -53,8 +65,7 @@ def load_session(session_token: str) -> dict | None:
     if not file_path.exists():
         return None
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(file_path.read_bytes())
 
     # Convert ISO format strings back to datetime objects
     return _parse_from_json(data)
@@ -66,50 +77,37 @@ def session_exists(session_token: str) -> bool:
     return file_path.exists()
 
 
-def _prepare_for_json(data: Any) -> Any:
-    """Recursively convert datetime objects to ISO format strings."""
-    if isinstance(data, datetime):
-        return data.isoformat()
-    elif isinstance(data, dict):
-        return {key: _prepare_for_json(value) for key, value in data.items()}
-    elif isinstance(data, list):
-        return [_prepare_for_json(item) for item in data]
-    else:
-        return data
-
-
-def _parse_from_json(data: Any) -> Any:
-    """Recursively convert ISO format strings to datetime objects."""
-    if isinstance(data, str):
-        # Try to parse as datetime
-        try:
-            return datetime.fromisoformat(data)
-        except (ValueError, AttributeError):
-            return data
-    elif isinstance(data, dict):
-        # Special handling for known datetime fields
-        result = {}
-        for key, value in data.items():
-            if key in ["created_at", "completed_at", "answered_at"]:
-                try:
-                    result[key] = datetime.fromisoformat(value) if value else None
-                except (ValueError, AttributeError, TypeError):
-                    result[key] = value
-            else:
-                result[key] = _parse_from_json(value)
-        return result
-    elif isinstance(data, list):
-        return [_parse_from_json(item) for item in data]
-    else:
-        return data
-
-
-def list_all_sessions() -> list[str]:
-    """List all session tokens."""
-    storage_path = Path(settings.data_storage_path)
-    if not storage_path.exists():
-        return []
-
-    return [
-        f.stem for f in storage_path.glob("*.json")
-    ]
+def _parse_datetime(value: Any) -> Any:
+    """Convert an ISO format string to a datetime, leaving other values as-is."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return value
+
+
+def _parse_from_json(data: dict) -> dict:
+    """Convert the known ISO format timestamp fields to datetime objects."""
+    for key in ("created_at", "completed_at"):
+        if key in data:
+            data[key] = _parse_datetime(data[key])
+
+    for answer in data.get("answers", []):
+        if "answered_at" in answer:
+            answer["answered_at"] = _parse_datetime(answer["answered_at"])
+
+    return data
+
+
+def list_all_sessions() -> Iterator[str]:
+    """Yield all session tokens."""
+    try:
+        entries = os.scandir(_STORAGE_PATH)
+    except FileNotFoundError:
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                yield entry.name[:-5]